@@ -11,29 +11,49 @@ LOGGING POLICY: Silent operation by default. Only log on STATUS CHANGES.
 - No logs for successful routine health checks
 - Log when a service transitions healthy→unhealthy or unhealthy→healthy
 - Log platform-level status changes (healthy→degraded→unhealthy)
+- "Still down" reminders are thinned exponentially (1st, 2nd, 4th, 8th... failed probe)
+
+BACKOFF: Unhealthy services are re-probed on an exponential backoff
+(200ms → the larger of 5s and 6 poll intervals) and reset on recovery.
+A single failed probe only marks a service "transitionally_down"; it takes
+2 consecutive failures to declare it unhealthy, which suppresses
+flapping-driven restarts. Transitionally down services still make the
+platform at least degraded.
 
 AUTO-RESTART: When a service goes down, attempts automatic restart using topology.yaml.
+- Only services seen healthy since the aggregator started (never ones that
+  were already down, e.g. deliberately not started in this mode)
 - Max 3 restart attempts per service per hour
 - Logs restart attempts and outcomes
 
 Usage:
-    uvicorn src.health_aggregator:app --host 0.0.0.0 --port 8088
+    uvicorn health_monitoring.health_aggregator:app --host 0.0.0.0 --port 8088
 """
 import asyncio
 import subprocess
 import time
 import logging
 import os
+import shlex
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional
+from urllib.parse import urlsplit, urlunsplit
+from typing import Callable, Dict, Any, Optional
 from enum import Enum
-from collections import defaultdict
+from collections import defaultdict, deque
 
 import httpx
+import orjson
 import yaml
 from fastapi import FastAPI, Response
 from pydantic import BaseModel, Field
 
+# Prefer the LibYAML C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _YamlLoader
+
 # Configure logger - show INFO and above for status changes
 logger = logging.getLogger("health_aggregator")
 logger.setLevel(logging.INFO)
@@ -86,23 +106,108 @@ SERVICE_NAME_MAP = {
     "code-orchestrator": "code-orchestrator",
 }
 
-# Restart tracking: max 3 attempts per service per hour
-RESTART_ATTEMPTS: Dict[str, list] = defaultdict(list)
+# Restart tracking: max 3 attempts per service per hour (monotonic timestamps)
 MAX_RESTART_ATTEMPTS = 3
 RESTART_WINDOW_SECONDS = 3600  # 1 hour
+RESTART_ATTEMPTS: Dict[str, deque] = defaultdict(
+    lambda: deque(maxlen=MAX_RESTART_ATTEMPTS)
+)
+
+# UTC ISO-8601 timestamp with a literal Z suffix
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+# Start commands containing these are run via /bin/sh -c; others are exec'd directly.
+# Same rule as platform_cli._split_command, so both launchers agree.
+SHELL_METACHARACTERS = ("&", "|", ";", ">", "<", "$", "`")
+# ...as are commands with an argument the shell would expand (~, globs)
+SHELL_EXPANSION_CHARS = ("~", "*", "?", "[")
+
+# Adaptive per-service timeouts: k * EWMA latency, floored, capped at self.timeout
+MIN_CHECK_TIMEOUT_SECONDS = 0.5
+TIMEOUT_LATENCY_MULTIPLIER = 4
+
+# Re-probe backoff for failing services, and hysteresis before declaring them down
+INITIAL_BACKOFF_SECONDS = 0.2
+MAX_BACKOFF_SECONDS = 5.0
+# ...raised to this many poll intervals so backoff still thins background polls
+MAX_BACKOFF_POLL_ROUNDS = 6
+FAILURES_BEFORE_UNHEALTHY = 2
+TRANSITIONALLY_DOWN = "transitionally_down"
+
+
+TOPOLOGY_PATH = os.path.join(os.path.dirname(__file__), "..", "topology.yaml")
+
+# Parsed topology keyed on file mtime: (st_mtime_ns, topology)
+_TOPOLOGY_CACHE: Optional[tuple[int, Dict[str, Any]]] = None
+# Service names in the cached topology, refreshed whenever it is re-parsed
+_KNOWN_TOPO_SERVICES: Optional[frozenset[str]] = None
 
 
 def load_topology() -> Dict[str, Any]:
-    """Load topology.yaml for restart commands."""
-    topology_path = os.path.join(os.path.dirname(__file__), "..", "topology.yaml")
+    """
+    Load topology.yaml for restart commands.
+    
+    The parsed result is cached and only re-read when the file's mtime
+    changes, so a multi-service outage doesn't re-parse it per restart.
+    """
+    global _TOPOLOGY_CACHE, _KNOWN_TOPO_SERVICES
     try:
-        with open(topology_path, 'r') as f:
-            return yaml.safe_load(f)
+        mtime = os.stat(TOPOLOGY_PATH).st_mtime_ns
+        if _TOPOLOGY_CACHE is not None and _TOPOLOGY_CACHE[0] == mtime:
+            return _TOPOLOGY_CACHE[1]
+        with open(TOPOLOGY_PATH, 'r') as f:
+            topology = yaml.load(f, Loader=_YamlLoader)
+        _TOPOLOGY_CACHE = (mtime, topology)
+        _KNOWN_TOPO_SERVICES = frozenset((topology or {}).get("services") or {})
+        return topology
     except Exception as e:
         logger.error(f"Failed to load topology.yaml: {e}")
         return {}
 
 
+def _pin_loopback(url: str) -> str:
+    """
+    Rewrite a `localhost` URL to 127.0.0.1.
+    
+    Skips the resolver lookup and the IPv6-first Happy-Eyeballs stall that
+    makes `localhost` connects slow on macOS.
+    """
+    parts = urlsplit(url)
+    if parts.hostname != "localhost":
+        return url
+    userinfo, _, _ = parts.netloc.rpartition("@")
+    netloc = "127.0.0.1" if parts.port is None else f"127.0.0.1:{parts.port}"
+    if userinfo:
+        netloc = f"{userinfo}@{netloc}"
+    return urlunsplit(parts._replace(netloc=netloc))
+
+
+def _split_command(cmd: str) -> list[str]:
+    """
+    Tokenize a topology start command into argv.
+    
+    Commands that rely on shell features (&&, pipes, $VARS, a trailing &,
+    leading VAR=value assignments, ~ or glob expansion) are wrapped in
+    `/bin/sh -c`, exactly as platform_cli does.
+    """
+    if not any(token in cmd for token in SHELL_METACHARACTERS):
+        argv = shlex.split(cmd)
+        needs_shell = (argv and "=" in argv[0]) or any(
+            char in arg for arg in argv for char in SHELL_EXPANSION_CHARS
+        )
+        if not needs_shell:
+            return argv
+    return ["/bin/sh", "-c", cmd]
+
+
+def _is_known_topology_service(topo_name: str) -> bool:
+    """Whether topology.yaml defines a service, without re-parsing on a miss."""
+    if _KNOWN_TOPO_SERVICES is None or topo_name not in _KNOWN_TOPO_SERVICES:
+        # Only re-parses if the file changed on disk since the last load
+        load_topology()
+    return _KNOWN_TOPO_SERVICES is not None and topo_name in _KNOWN_TOPO_SERVICES
+
+
 def attempt_restart(service_name: str) -> bool:
     """
     Attempt to restart a service using topology.yaml configuration.
@@ -112,11 +217,17 @@ def attempt_restart(service_name: str) -> bool:
     # Map health check name to topology name
     topo_name = SERVICE_NAME_MAP.get(service_name, service_name)
     
+    # Unknown services fail fast without consuming a restart attempt
+    if not _is_known_topology_service(topo_name):
+        logger.error(f"❌ No topology config for service: {topo_name}")
+        return False
+    
     # Check rate limit
-    now = time.time()
+    now = time.monotonic()
     attempts = RESTART_ATTEMPTS[service_name]
-    # Remove old attempts outside the window
-    attempts[:] = [t for t in attempts if now - t < RESTART_WINDOW_SECONDS]
+    # Drop old attempts outside the window (oldest first)
+    while attempts and now - attempts[0] >= RESTART_WINDOW_SECONDS:
+        attempts.popleft()
     
     if len(attempts) >= MAX_RESTART_ATTEMPTS:
         logger.warning(
@@ -159,10 +270,10 @@ def attempt_restart(service_name: str) -> bool:
             if not val.startswith("${"):  # Skip unresolved vars
                 env[key] = val
         
-        # Use nohup to keep it running after this process
+        # Detached session keeps it running after this process
         subprocess.Popen(
-            f"cd {work_dir} && {start_cmd}",
-            shell=True,
+            _split_command(start_cmd),
+            cwd=work_dir,
             env=env,
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
@@ -193,31 +304,140 @@ class HealthAggregator:
     Attributes:
         services: Dict mapping service name to health endpoint URL
         timeout: Timeout in seconds for each health check
+
+    A single pooled HTTP/2 client is shared across all checks. When
+    start_polling() is running, a background task refreshes the result
+    every `poll_interval` seconds and check_all() returns it without any
+    outbound requests. Call aclose() on shutdown to stop the poller and
+    release pooled connections.
     """
     
     def __init__(
         self,
         services: Optional[Dict[str, str]] = None,
-        timeout: float = 5.0
+        timeout: float = 5.0,
+        cache_ttl: float = 2.0,
+        poll_interval: float = 5.0
     ):
         """
         Initialize HealthAggregator.
         
         Args:
             services: Dict mapping service name to health endpoint URL.
-                     Defaults to standard platform services.
+                     Defaults to standard platform services. `localhost`
+                     hosts are pinned to 127.0.0.1.
             timeout: Timeout in seconds for each health check.
+            cache_ttl: Seconds a check_all() result is reused before
+                      polling the services again (when not background polling).
+            poll_interval: Seconds between background polls.
         """
-        self.services = services or DEFAULT_SERVICES.copy()
+        self.services = {
+            name: _pin_loopback(url)
+            for name, url in (services or DEFAULT_SERVICES).items()
+        }
         self.timeout = timeout
+        # Long-lived pooled client: reuses keep-alive connections across polls
+        self._client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60),
+            timeout=timeout
+        )
         # Track previous status to detect changes (only log on transitions)
-        self._previous_service_status: Dict[str, str] = {}
+        self._prev_unhealthy: set[str] = set()
+        # Only services seen healthy at least once are auto-restarted
+        self._ever_healthy: set[str] = set()
         self._previous_platform_status: Optional[str] = None
+        # Latest (monotonic_ts, result); concurrent callers coalesce onto one fanout
+        self._cache_ttl = cache_ttl
+        self._latest: Optional[tuple[float, Dict[str, Any]]] = None
+        self._cache_lock = asyncio.Lock()
+        # Background poller keeps _latest warm so requests never wait on services
+        self._poll_interval = poll_interval
+        self._poll_task: Optional[asyncio.Task] = None
+        # Called with each fresh result (e.g. to pre-render Prometheus output)
+        self._result_listeners: list[Callable[[Dict[str, Any]], None]] = []
+        # EWMA of healthy-response latency (ms) per service, drives adaptive timeouts
+        self._latency_ewma: Dict[str, float] = {}
+        self._ewma_alpha = 0.2
+        # Failing services: (next_probe_ts, current_delay) and consecutive failure count
+        self._backoff: Dict[str, tuple[float, float]] = {}
+        self._max_backoff = max(MAX_BACKOFF_SECONDS, MAX_BACKOFF_POLL_ROUNDS * poll_interval)
+        self._consecutive_failures: Dict[str, int] = {}
+        self._last_service_results: Dict[str, Dict[str, Any]] = {}
+
+    def add_result_listener(self, listener: Callable[[Dict[str, Any]], None]) -> None:
+        """Register a callback invoked with every freshly polled result."""
+        if listener not in self._result_listeners:
+            self._result_listeners.append(listener)
+    
+    def remove_result_listener(self, listener: Callable[[Dict[str, Any]], None]) -> None:
+        """Unregister a callback added with add_result_listener()."""
+        if listener in self._result_listeners:
+            self._result_listeners.remove(listener)
+    
+    def start_polling(self) -> None:
+        """Start the background poller (no-op if already running)."""
+        if self._poll_task is None or self._poll_task.done():
+            self._poll_task = asyncio.create_task(self._poll_loop())
+    
+    async def stop_polling(self) -> None:
+        """Cancel the background poller and wait for it to exit."""
+        if self._poll_task is not None:
+            self._poll_task.cancel()
+            try:
+                await self._poll_task
+            except asyncio.CancelledError:
+                pass
+            self._poll_task = None
     
-    async def check_all(self) -> Dict[str, Any]:
+    async def aclose(self) -> None:
+        """Stop polling and close the shared HTTP client."""
+        await self.stop_polling()
+        await self._client.aclose()
+    
+    async def _poll_loop(self) -> None:
+        """Refresh the shared result every poll_interval seconds."""
+        while True:
+            try:
+                async with self._cache_lock:
+                    await self._refresh()
+            except Exception as e:
+                logger.error(f"Health poll failed: {e}")
+            await asyncio.sleep(self._poll_interval)
+    
+    async def _refresh(self) -> Dict[str, Any]:
+        """Poll all services and swap in the new result."""
+        result = await self._poll_once()
+        self._latest = (time.monotonic(), result)
+        for listener in self._result_listeners:
+            try:
+                listener(result)
+            except Exception as e:
+                logger.error(f"Health result listener failed: {e}")
+        return result
+    
+    def _fresh_result(self) -> Optional[Dict[str, Any]]:
+        """Return the latest result if the poller owns it or it is within TTL."""
+        if self._latest is None:
+            return None
+        polled_at, result = self._latest
+        polling = self._poll_task is not None and not self._poll_task.done()
+        if polling or time.monotonic() - polled_at < self._cache_ttl:
+            return result
+        return None
+    
+    async def check_all(self, force: bool = False) -> Dict[str, Any]:
         """
         Check health of all services concurrently.
         
+        While the background poller runs this returns its latest result
+        immediately. Otherwise results are cached for `cache_ttl` seconds
+        so bursts of scrapes (Prometheus + dashboards) trigger a single
+        upstream fanout.
+        
+        Args:
+            force: Bypass the cached result and poll all services.
+        
         Returns:
             Dict with aggregate status, timestamp, and per-service status.
             
@@ -231,26 +451,48 @@ class HealthAggregator:
                 }
             }
         """
-        # Check all services concurrently
-        tasks = [
-            self._check_service(name, url)
-            for name, url in self.services.items()
-        ]
-        results = await asyncio.gather(*tasks)
+        if not force:
+            result = self._fresh_result()
+            if result is not None:
+                return result
+        
+        async with self._cache_lock:
+            # Another caller may have refreshed while we waited for the lock
+            if not force:
+                result = self._fresh_result()
+                if result is not None:
+                    return result
+            return await self._refresh()
+    
+    async def _poll_once(self) -> Dict[str, Any]:
+        """Poll every due service once and build the aggregate result."""
+        # Services still inside their backoff window reuse their last result
+        now = time.monotonic()
+        due = {
+            name: url for name, url in self.services.items()
+            if self._is_due(name, now)
+        }
+        
+        for name, result in await self._check_due_services(due):
+            self._last_service_results[name] = self._apply_backoff(name, result, now)
         
         # Build services dict from results
         services_status = {}
-        for (name, _), result in zip(self.services.items(), results):
-            services_status[name] = result
+        for name in self.services:
+            services_status[name] = self._last_service_results[name]
         
         # Determine aggregate status
-        unhealthy_count = sum(
-            1 for s in services_status.values()
-            if s.get("status") == "unhealthy"
+        current_unhealthy = {
+            name for name, s in services_status.items()
+            if s["status"] == "unhealthy"
+        }
+        unhealthy_count = len(current_unhealthy)
+        # Failed once but not yet declared unhealthy: not healthy either
+        transitional_count = sum(
+            1 for s in services_status.values() if s["status"] == TRANSITIONALLY_DOWN
         )
-        total_services = len(self.services)
         
-        if unhealthy_count == 0:
+        if unhealthy_count == 0 and transitional_count == 0:
             aggregate_status = HealthStatus.HEALTHY
         elif unhealthy_count <= 2:
             aggregate_status = HealthStatus.DEGRADED
@@ -258,52 +500,138 @@ class HealthAggregator:
             aggregate_status = HealthStatus.UNHEALTHY
         
         # LOG ONLY ON STATUS CHANGES (silent operation otherwise)
-        self._log_status_changes(services_status, aggregate_status.value)
+        self._log_status_changes(
+            services_status, current_unhealthy, aggregate_status.value, set(due)
+        )
         
         return {
             "status": aggregate_status.value,
-            "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+            "timestamp": datetime.now(timezone.utc).strftime(TIMESTAMP_FORMAT),
             "services": services_status
         }
     
+    async def _check_due_services(
+        self,
+        due: Dict[str, str]
+    ) -> list[tuple[str, Dict[str, Any]]]:
+        """
+        Check services concurrently under an aggregate deadline of self.timeout.
+        
+        Checks still in flight at the deadline are cancelled and reported as
+        unhealthy, so one hung service cannot hold up the whole poll. All
+        outstanding checks are also cancelled if the poll itself is cancelled.
+        """
+        if not due:
+            return []
+        
+        tasks = {
+            asyncio.create_task(self._check_service(name, url)): name
+            for name, url in due.items()
+        }
+        try:
+            done, pending = await asyncio.wait(tasks, timeout=self.timeout)
+        finally:
+            for task in tasks:
+                task.cancel()
+        
+        results = [task.result() for task in done]
+        for task in pending:
+            name = tasks[task]
+            self._latency_ewma.pop(name, None)
+            results.append((name, {
+                "status": "unhealthy",
+                "latency_ms": round(self.timeout * 1000, 2),
+                "error": "timeout (aggregate cutoff)"
+            }))
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        return results
+    
+    def _is_due(self, service_name: str, now: float) -> bool:
+        """Whether a service should be probed this round."""
+        if service_name not in self._last_service_results:
+            return True
+        backoff = self._backoff.get(service_name)
+        return backoff is None or backoff[0] <= now
+    
+    def _apply_backoff(
+        self,
+        service_name: str,
+        result: Dict[str, Any],
+        now: float
+    ) -> Dict[str, Any]:
+        """
+        Update backoff/hysteresis state from a fresh probe result.
+        
+        Returns:
+            The result, downgraded to TRANSITIONALLY_DOWN if the service has
+            not yet failed FAILURES_BEFORE_UNHEALTHY consecutive probes.
+        """
+        if result["status"] == "healthy":
+            self._backoff.pop(service_name, None)
+            self._consecutive_failures.pop(service_name, None)
+            return result
+        
+        failures = self._consecutive_failures.get(service_name, 0) + 1
+        self._consecutive_failures[service_name] = failures
+        _, delay = self._backoff.get(service_name, (0.0, 0.0))
+        delay = min(self._max_backoff, delay * 2 or INITIAL_BACKOFF_SECONDS)
+        self._backoff[service_name] = (now + delay, delay)
+        
+        if failures < FAILURES_BEFORE_UNHEALTHY:
+            return {**result, "status": TRANSITIONALLY_DOWN}
+        return result
+    
     def _log_status_changes(
         self,
         services_status: Dict[str, Dict[str, Any]],
-        platform_status: str
+        current_unhealthy: set[str],
+        platform_status: str,
+        probed: set[str]
     ) -> None:
         """
         Log only when status transitions occur. Silent otherwise.
-        Triggers auto-restart when a service goes down.
+        Triggers auto-restart when a service that had been healthy goes down.
         
         This implements the "alert on change" policy - no logs for routine
         successful health checks, only logs when something goes wrong or recovers.
+        A service already down when first observed is not a transition.
+        "Still down" reminders are only emitted for services probed this round,
+        on the 1st, 2nd, 4th, 8th... consecutive failure.
         """
-        # Check for service-level status changes
-        for service_name, status_info in services_status.items():
-            current_status = status_info.get("status", "unknown")
-            previous_status = self._previous_service_status.get(service_name)
-            
-            if previous_status is not None and current_status != previous_status:
-                if current_status == "unhealthy":
-                    error = status_info.get("error", "unknown error")
-                    logger.warning(
-                        f"🔴 SERVICE DOWN: {service_name} is now unhealthy ({error})"
-                    )
-                    # Trigger auto-restart
-                    attempt_restart(service_name)
-                else:
-                    logger.info(
-                        f"🟢 SERVICE RECOVERED: {service_name} is now healthy"
-                    )
-            elif current_status == "unhealthy" and previous_status == "unhealthy":
-                # Service is STILL down - log periodic reminder
-                error = status_info.get("error", "unknown error")
+        # Service-level changes as set differences against the previous round.
+        # Hysteresis means a service is only unhealthy after a failed probe
+        # while already failing, so anything leaving the set has recovered.
+        self._ever_healthy.update(
+            name for name, s in services_status.items() if s["status"] == "healthy"
+        )
+        newly_down = (current_unhealthy - self._prev_unhealthy) & self._ever_healthy
+        recovered = self._prev_unhealthy - current_unhealthy
+        still_down = current_unhealthy & self._prev_unhealthy & probed
+        
+        for service_name in sorted(newly_down):
+            error = services_status[service_name].get("error", "unknown error")
+            logger.warning(
+                f"🔴 SERVICE DOWN: {service_name} is now unhealthy ({error})"
+            )
+            # Trigger auto-restart
+            attempt_restart(service_name)
+        
+        for service_name in sorted(recovered):
+            logger.info(
+                f"🟢 SERVICE RECOVERED: {service_name} is now healthy"
+            )
+        
+        for service_name in sorted(still_down):
+            # Service is STILL down - remind on exponentially spaced failures
+            failures = self._consecutive_failures.get(service_name, 0)
+            if failures & (failures - 1) == 0:
+                error = services_status[service_name].get("error", "unknown error")
                 logger.warning(
                     f"🔴 SERVICE STILL DOWN: {service_name} ({error})"
                 )
-            
-            # Update tracked status
-            self._previous_service_status[service_name] = current_status
+        
+        self._prev_unhealthy = current_unhealthy
         
         # Check for platform-level status changes
         if self._previous_platform_status is not None and platform_status != self._previous_platform_status:
@@ -320,57 +648,80 @@ class HealthAggregator:
         self,
         service_name: str,
         url: str
-    ) -> Dict[str, Any]:
+    ) -> tuple[str, Dict[str, Any]]:
         """
         Check health of a single service.
         
+        The request timeout adapts to the service's observed latency
+        (TIMEOUT_LATENCY_MULTIPLIER x EWMA, floored at
+        MIN_CHECK_TIMEOUT_SECONDS and capped at self.timeout) so a hung
+        service fails fast without penalising normal jitter.
+        
         Args:
             service_name: Name of the service (for logging)
             url: Health endpoint URL
             
         Returns:
-            Dict with status, latency_ms, and optional error message.
+            (service_name, result) where result has status, latency_ms,
+            and optional error message.
         """
         start_time = time.perf_counter()
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url)
-                latency_ms = (time.perf_counter() - start_time) * 1000
-                
-                if response.status_code == 200:
-                    return {
-                        "status": "healthy",
-                        "latency_ms": round(latency_ms, 2)
-                    }
-                else:
-                    return {
-                        "status": "unhealthy",
-                        "latency_ms": round(latency_ms, 2),
-                        "error": f"HTTP {response.status_code}"
-                    }
-                    
+            response = await self._client.get(
+                url, timeout=httpx.Timeout(self._effective_timeout(service_name))
+            )
         except httpx.TimeoutException:
-            latency_ms = (time.perf_counter() - start_time) * 1000
-            return {
-                "status": "unhealthy",
-                "latency_ms": round(latency_ms, 2),
-                "error": "timeout"
-            }
+            # Forget the learned latency so the next probe gets the full timeout
+            self._latency_ewma.pop(service_name, None)
+            error = "timeout"
         except httpx.ConnectError as e:
-            latency_ms = (time.perf_counter() - start_time) * 1000
-            return {
-                "status": "unhealthy",
-                "latency_ms": round(latency_ms, 2),
-                "error": f"connection refused: {str(e)}"
-            }
+            error = f"connection refused: {str(e)}"
         except Exception as e:
-            latency_ms = (time.perf_counter() - start_time) * 1000
-            return {
+            error = str(e)
+        else:
+            # httpx measures request→response-closed itself; pre-read responses
+            # from non-network transports carry no timing, so fall back
+            try:
+                latency_ms = response.elapsed.total_seconds() * 1000
+            except RuntimeError:
+                latency_ms = (time.perf_counter() - start_time) * 1000
+            
+            if response.status_code == 200:
+                self._record_latency(service_name, latency_ms)
+                return service_name, {
+                    "status": "healthy",
+                    "latency_ms": round(latency_ms, 2)
+                }
+            return service_name, {
                 "status": "unhealthy",
                 "latency_ms": round(latency_ms, 2),
-                "error": str(e)
+                "error": f"HTTP {response.status_code}"
             }
+        
+        latency_ms = (time.perf_counter() - start_time) * 1000
+        return service_name, {
+            "status": "unhealthy",
+            "latency_ms": round(latency_ms, 2),
+            "error": error
+        }
+    
+    def _effective_timeout(self, service_name: str) -> float:
+        """Timeout in seconds for the next check of a service."""
+        ewma_ms = self._latency_ewma.get(service_name)
+        if ewma_ms is None:
+            return self.timeout
+        adaptive = TIMEOUT_LATENCY_MULTIPLIER * ewma_ms / 1000
+        return max(MIN_CHECK_TIMEOUT_SECONDS, min(self.timeout, adaptive))
+    
+    def _record_latency(self, service_name: str, latency_ms: float) -> None:
+        """Fold a healthy response latency into the service's EWMA."""
+        previous = self._latency_ewma.get(service_name)
+        if previous is None:
+            self._latency_ewma[service_name] = latency_ms
+        else:
+            alpha = self._ewma_alpha
+            self._latency_ewma[service_name] = alpha * latency_ms + (1 - alpha) * previous
 
 
 # Global aggregator instance
@@ -385,6 +736,14 @@ def get_aggregator() -> HealthAggregator:
     return _aggregator
 
 
+async def close_aggregator() -> None:
+    """Close the global HealthAggregator; the next get_aggregator() builds a fresh one."""
+    global _aggregator
+    if _aggregator is not None:
+        aggregator, _aggregator = _aggregator, None
+        await aggregator.aclose()
+
+
 def create_app() -> FastAPI:
     """
     Create FastAPI application for health aggregation.
@@ -392,19 +751,33 @@ def create_app() -> FastAPI:
     Returns:
         Configured FastAPI application instance.
     """
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        """Run the background poller for the lifetime of the app."""
+        aggregator = get_aggregator()
+        aggregator.start_polling()
+        yield
+        await close_aggregator()
+    
     app = FastAPI(
         title="AI Platform Health Aggregator",
         description="Central health status aggregation for AI Platform services",
-        version="1.0.0"
+        version="1.0.0",
+        lifespan=lifespan
     )
     
+    # PlatformHealth documents the schema in OpenAPI only; the hot path
+    # encodes the aggregator dict with orjson, skipping Pydantic validation.
     @app.get(
         "/platform/health",
-        response_model=PlatformHealth,
         summary="Get Platform Health",
-        description="Returns aggregate health status of all platform services"
+        description="Returns aggregate health status of all platform services",
+        responses={
+            200: {"model": PlatformHealth},
+            503: {"model": PlatformHealth},
+        }
     )
-    async def platform_health(response: Response):
+    async def platform_health():
         """
         Check health of all platform services.
         
@@ -415,10 +788,12 @@ def create_app() -> FastAPI:
         aggregator = get_aggregator()
         result = await aggregator.check_all()
         
-        if result["status"] == HealthStatus.UNHEALTHY.value:
-            response.status_code = 503
-        
-        return result
+        status_code = 503 if result["status"] == HealthStatus.UNHEALTHY.value else 200
+        return Response(
+            content=orjson.dumps(result),
+            media_type="application/json",
+            status_code=status_code
+        )
     
     @app.get("/health", summary="Aggregator Health")
     async def health():
@@ -432,6 +807,11 @@ def create_app() -> FastAPI:
 app = create_app()
 
 
-if __name__ == "__main__":
+def main() -> None:
+    """Run the health aggregator with uvicorn (`health-aggregator` script)."""
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8088)
+
+
+if __name__ == "__main__":
+    main()
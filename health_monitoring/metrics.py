@@ -18,20 +18,21 @@ Metrics:
 
 Usage:
     # Standalone metrics server
-    uvicorn src.metrics:metrics_app --host 0.0.0.0 --port 8089
+    uvicorn health_monitoring.metrics:metrics_app --host 0.0.0.0 --port 8089
     
     # Or integrate with health aggregator
-    from src.metrics import collect_metrics
+    from health_monitoring.metrics import collect_metrics
     await collect_metrics()
 """
 import asyncio
 import logging
+from contextlib import asynccontextmanager
 from typing import Dict, Any, Optional
 
 from fastapi import FastAPI, Response
 from prometheus_client import Gauge, generate_latest, CONTENT_TYPE_LATEST, CollectorRegistry
 
-from health_monitoring.health_aggregator import HealthAggregator, get_aggregator
+from health_monitoring.health_aggregator import HealthAggregator, close_aggregator, get_aggregator
 
 # Silence uvicorn access logs for metrics endpoint (very noisy)
 logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
@@ -64,6 +65,16 @@ PLATFORM_HEALTH_STATUS = Gauge(
     registry=REGISTRY
 )
 
+# Labelled child gauges per service; services are fixed, so resolve .labels() once
+_STATUS_CHILDREN: Dict[str, Gauge] = {}
+_LATENCY_CHILDREN: Dict[str, Gauge] = {}
+
+# Prometheus text output rendered once per aggregator poll (None until first poll)
+_rendered_metrics: Optional[bytes] = None
+
+# Upper bound for MetricsCollector's sleep after consecutive collection errors
+MAX_ERROR_BACKOFF_SECONDS = 300.0
+
 # Mapping of status strings to numeric values
 STATUS_VALUES = {
     "healthy": 1.0,
@@ -94,12 +105,33 @@ def update_metrics(health_result: Dict[str, Any]) -> None:
     for service_name, service_status in services.items():
         # Set health status (1 = healthy, 0 = unhealthy)
         is_healthy = service_status.get("status") == "healthy"
-        SERVICE_HEALTH_STATUS.labels(service=service_name).set(1.0 if is_healthy else 0.0)
+        status_child = _STATUS_CHILDREN.get(service_name)
+        if status_child is None:
+            status_child = SERVICE_HEALTH_STATUS.labels(service=service_name)
+            _STATUS_CHILDREN[service_name] = status_child
+        status_child.set(1.0 if is_healthy else 0.0)
         
         # Set latency if available
         latency = service_status.get("latency_ms")
         if latency is not None:
-            SERVICE_HEALTH_LATENCY.labels(service=service_name).set(latency)
+            latency_child = _LATENCY_CHILDREN.get(service_name)
+            if latency_child is None:
+                latency_child = SERVICE_HEALTH_LATENCY.labels(service=service_name)
+                _LATENCY_CHILDREN[service_name] = latency_child
+            latency_child.set(latency)
+
+
+def render_metrics() -> bytes:
+    """Render the registry to Prometheus text format and cache the bytes."""
+    global _rendered_metrics
+    _rendered_metrics = generate_latest(REGISTRY)
+    return _rendered_metrics
+
+
+def _on_health_result(health_result: Dict[str, Any]) -> None:
+    """Aggregator listener: update gauges and pre-render /metrics output."""
+    update_metrics(health_result)
+    render_metrics()
 
 
 async def collect_metrics() -> Dict[str, Any]:
@@ -122,10 +154,23 @@ def create_metrics_app() -> FastAPI:
     Returns:
         Configured FastAPI application instance.
     """
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        """Run the aggregator's background poller for the lifetime of the app."""
+        aggregator = get_aggregator()
+        aggregator.add_result_listener(_on_health_result)
+        aggregator.start_polling()
+        yield
+        global _rendered_metrics
+        aggregator.remove_result_listener(_on_health_result)
+        _rendered_metrics = None
+        await close_aggregator()
+    
     app = FastAPI(
         title="AI Platform Metrics",
         description="Prometheus metrics for AI Platform health monitoring",
-        version="1.0.0"
+        version="1.0.0",
+        lifespan=lifespan
     )
     
     @app.get("/metrics", summary="Prometheus Metrics")
@@ -133,11 +178,17 @@ def create_metrics_app() -> FastAPI:
         """
         Expose Prometheus metrics.
         
-        Collects fresh metrics before returning.
+        Serves the output rendered after the aggregator's latest poll, so
+        staleness is bounded by the poll interval. Before the first poll
+        (or without the background poller) metrics are collected inline and
+        rendered in a worker thread to keep the event loop free.
         """
-        await collect_metrics()
+        content = _rendered_metrics
+        if content is None:
+            await collect_metrics()
+            content = await asyncio.to_thread(generate_latest, REGISTRY)
         return Response(
-            content=generate_latest(REGISTRY),
+            content=content,
             media_type=CONTENT_TYPE_LATEST
         )
     
@@ -186,16 +237,31 @@ class MetricsCollector:
         self._logger = logging.getLogger("metrics_collector")
     
     async def start(self) -> None:
-        """Start collecting metrics in the background."""
+        """
+        Start collecting metrics in the background.
+        
+        Consecutive errors back off exponentially (interval * 2^n, capped at
+        MAX_ERROR_BACKOFF_SECONDS); cancellation propagates immediately.
+        """
         self._running = True
+        error_streak = 0
         while self._running:
             try:
                 await collect_metrics()
+                error_streak = 0
+                delay = self.interval_seconds
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
                 # Only log errors, not routine operations
                 self._logger.error(f"Error collecting metrics: {e}")
+                delay = min(
+                    self.interval_seconds * 2 ** error_streak,
+                    MAX_ERROR_BACKOFF_SECONDS
+                )
+                error_streak += 1
             
-            await asyncio.sleep(self.interval_seconds)
+            await asyncio.sleep(delay)
     
     async def stop(self) -> None:
         """Stop collecting metrics."""
@@ -217,6 +283,11 @@ class MetricsCollector:
         await self.stop()
 
 
-if __name__ == "__main__":
+def main() -> None:
+    """Run the metrics server with uvicorn (`metrics-server` script)."""
     import uvicorn
     uvicorn.run(metrics_app, host="0.0.0.0", port=8089)
+
+
+if __name__ == "__main__":
+    main()
@@ -13,18 +13,34 @@ Implements: ARCHITECTURE_DECISION_RECORD.md
 """
 
 import argparse
+import asyncio
+import graphlib
+import http.client
 import json
 import os
+import select
+import shlex
 import signal
+import socket
 import subprocess
 import sys
+import threading
 import time
+from collections import ChainMap, defaultdict
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Final, Optional
 
 import yaml
 
+# Prefer the LibYAML C loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _YamlDumper, CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeDumper as _YamlDumper, SafeLoader as _YamlLoader
+
 # =============================================================================
 # Configuration
 # =============================================================================
@@ -38,6 +54,40 @@ LOG_DIR = PLATFORM_ROOT / "platform-cli" / "logs"
 DEFAULT_HEALTH_ENDPOINT = "/health"
 DOCKER_COMPOSE_UP_CMD = "docker compose up -d"
 
+# Start commands containing these are run via /bin/sh -c; others are exec'd directly.
+# Same rule as health_monitoring.health_aggregator._split_command (auto-restart).
+SHELL_METACHARACTERS = ("&", "|", ";", ">", "<", "$", "`")
+# ...as are commands with an argument the shell would expand (~, globs)
+SHELL_EXPANSION_CHARS = ("~", "*", "?", "[")
+
+# Probes target localhost, resolved once here rather than on every connect
+try:
+    _LOCAL_IP = socket.gethostbyname("localhost")
+except OSError:  # pragma: no cover
+    _LOCAL_IP = "127.0.0.1"
+
+# Port probes connect to loopback; anything listening answers within this
+PORT_PROBE_TIMEOUT = 0.05
+
+# _wait_for_health polling: exponential backoff between attempts. The HTTP
+# timeout only applies once the port is open, so slow /health handlers
+# (e.g. a model warming up) still get the full 2s.
+HEALTH_PROBE_TIMEOUT = 2.0
+HEALTH_POLL_INITIAL_DELAY = 0.1
+HEALTH_POLL_MAX_DELAY = 1.0
+
+# `status`/`doctor` scans: timeout for the health endpoint's status line
+SCAN_HTTP_TIMEOUT = 2.0
+
+# Grace period between SIGTERM and SIGKILL when stopping native services
+STOP_GRACE_PERIOD = 5.0
+EXIT_POLL_INTERVAL = 0.05
+
+# `platform logs`: lines of backlog shown before following, like tail -f
+LOG_TAIL_LINES = 10
+LOG_TAIL_BYTES = 64 * 1024
+LOG_POLL_INTERVAL = 0.25
+
 # Colors
 GREEN = "\033[0;32m"
 RED = "\033[0;31m"
@@ -46,6 +96,104 @@ BLUE = "\033[0;34m"
 NC = "\033[0m"
 
 
+# =============================================================================
+# Default Topology
+# =============================================================================
+
+# Written by `platform init`; also the schema reference for _service_errors
+DEFAULT_TOPOLOGY: Final[dict] = {
+    "version": "1.0",
+    "modes": {
+        "docker": {
+            "qdrant": "docker",
+            "llm-gateway": "docker",
+            "semantic-search": "docker",
+            "code-orchestrator": "docker",
+            "inference": "docker",
+        },
+        "hybrid": {
+            "qdrant": "docker",
+            "llm-gateway": "docker",
+            "semantic-search": "docker",
+            "code-orchestrator": "docker",
+            "inference": "native",  # Native for Metal GPU
+        },
+        "native": {
+            "qdrant": "docker",  # Qdrant always Docker
+            "llm-gateway": "native",
+            "semantic-search": "native",
+            "code-orchestrator": "native",
+            "inference": "native",
+        },
+    },
+    "services": {
+        "qdrant": {
+            "path": "qdrant",
+            "port": 6333,
+            "health_endpoint": "/healthz",
+            "start": {
+                "docker": DOCKER_COMPOSE_UP_CMD,
+            },
+            "depends_on": [],
+        },
+        "inference": {
+            "path": "inference-service",
+            "port": 8085,
+            "health_endpoint": DEFAULT_HEALTH_ENDPOINT,
+            "start": {
+                "docker": DOCKER_COMPOSE_UP_CMD,
+                # Venv interpreter directly: activation only mutates PATH
+                "native": ".venv/bin/python -m uvicorn src.main:app --host 0.0.0.0 --port 8085",
+            },
+            "env": {
+                "INFERENCE_MODELS_DIR": "/Users/kevintoles/POC/ai-models/models",
+                "INFERENCE_CONFIG_DIR": "/Users/kevintoles/POC/inference-service/config",
+                "INFERENCE_GPU_LAYERS": "-1",
+                "INFERENCE_DEFAULT_PRESET": "",  # No auto-load, load on demand
+            },
+            "depends_on": [],
+        },
+        "llm-gateway": {
+            "path": "llm-gateway",
+            "port": 8080,
+            "health_endpoint": DEFAULT_HEALTH_ENDPOINT,
+            "start": {
+                "docker": DOCKER_COMPOSE_UP_CMD,
+            },
+            "depends_on": ["inference"],
+        },
+        "semantic-search": {
+            "path": "semantic-search-service",
+            "port": 8084,
+            "health_endpoint": DEFAULT_HEALTH_ENDPOINT,
+            "start": {
+                "docker": DOCKER_COMPOSE_UP_CMD,
+            },
+            "depends_on": ["qdrant"],
+        },
+        "code-orchestrator": {
+            "path": "Code-Orchestrator-Service",
+            "port": 8083,
+            "health_endpoint": DEFAULT_HEALTH_ENDPOINT,
+            "start": {
+                "docker": DOCKER_COMPOSE_UP_CMD,
+            },
+            "depends_on": ["llm-gateway", "semantic-search"],
+        },
+    },
+}
+
+# Fields every service entry must define (the rest have defaults)
+REQUIRED_SERVICE_FIELDS = ("path", "port")
+
+# Expected type of each service field, taken from the default topology
+SERVICE_FIELD_TYPES: Final[dict] = {
+    field: type(value)
+    for service in DEFAULT_TOPOLOGY["services"].values()
+    for field, value in service.items()
+}
+
+
 # =============================================================================
 # Data Classes
 # =============================================================================
@@ -57,9 +205,156 @@ class ServiceConfig:
     path: Path
     port: int
     health_endpoint: str
-    start_command: dict  # mode -> command
+    start_command: dict[str, list[str]]  # mode -> argv
     depends_on: list[str]
     env: dict[str, str]
+    compose_service_name: str  # Service name inside the compose project
+
+
+def _split_command(cmd: str) -> list[str]:
+    """Tokenize a topology start command into argv once, at load time.
+
+    Commands that rely on shell features (&&, pipes, $VARS, a trailing &,
+    leading VAR=value assignments, ~ or glob expansion) are wrapped in
+    `/bin/sh -c` so existing topologies keep working.
+    """
+    if not any(token in cmd for token in SHELL_METACHARACTERS):
+        argv = shlex.split(cmd)
+        needs_shell = (argv and "=" in argv[0]) or any(
+            char in arg for arg in argv for char in SHELL_EXPANSION_CHARS
+        )
+        if not needs_shell:
+            return argv
+    return ["/bin/sh", "-c", cmd]
+
+
+def _service_errors(name: str, config) -> list[str]:
+    """Check one service entry against the default topology's schema."""
+    if not isinstance(config, dict):
+        return [f"{name}: expected a mapping"]
+    errors = [
+        f"{name}: missing '{field}'"
+        for field in REQUIRED_SERVICE_FIELDS
+        if field not in config
+    ]
+    for field, value in config.items():
+        expected = SERVICE_FIELD_TYPES.get(field)
+        if expected is not None and not isinstance(value, expected):
+            errors.append(
+                f"{name}.{field}: expected {expected.__name__}, got {type(value).__name__}"
+            )
+    return errors
+
+
+def _service_from_config(name: str, config: dict) -> ServiceConfig:
+    """Build a ServiceConfig from a validated topology service entry."""
+    return ServiceConfig(
+        name=name,
+        path=PLATFORM_ROOT / config["path"],
+        port=config["port"],
+        health_endpoint=config.get("health_endpoint", DEFAULT_HEALTH_ENDPOINT),
+        start_command={
+            mode: _split_command(cmd)
+            for mode, cmd in config.get("start", {}).items()
+        },
+        depends_on=config.get("depends_on", []),
+        env=config.get("env", {}),
+        compose_service_name=config.get("compose_service_name", name),
+    )
+
+
+def _wait_for_exit(pid: int, timeout: float) -> bool:
+    """Block until process `pid` exits or `timeout` elapses.
+
+    Returns True as soon as the process is gone. Uses a pidfd on Linux and a
+    kqueue NOTE_EXIT filter on macOS so we wake on exit instead of sleeping;
+    falls back to polling where neither is available or usable (old kernels,
+    seccomp-restricted containers).
+    """
+    deadline = time.monotonic() + timeout
+    try:
+        if hasattr(os, "pidfd_open"):
+            pidfd = os.pidfd_open(pid)
+            try:
+                readable, _, _ = select.select([pidfd], [], [], timeout)
+                return bool(readable)
+            finally:
+                os.close(pidfd)
+        if hasattr(select, "kqueue"):
+            kq = select.kqueue()
+            try:
+                event = select.kevent(
+                    pid,
+                    filter=select.KQ_FILTER_PROC,
+                    flags=select.KQ_EV_ADD | select.KQ_EV_ONESHOT,
+                    fflags=select.KQ_NOTE_EXIT,
+                )
+                return bool(kq.control([event], 1, timeout))
+            finally:
+                kq.close()
+    except ProcessLookupError:
+        return True
+    except OSError:
+        pass  # Poll below for whatever is left of the timeout
+    
+    while True:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(EXIT_POLL_INTERVAL)
+
+
+def _tail(path: Path, lines: int = LOG_TAIL_LINES):
+    """Follow a log file in-process, like `tail -f`.
+
+    Wakes on kqueue vnode events on macOS and polls elsewhere. Reopens the
+    file when it is replaced (rotation) and rewinds when it is truncated
+    (a service restart rewrites its log).
+    """
+    out = sys.stdout.buffer
+    kq = select.kqueue() if hasattr(select, "kqueue") else None
+    f = open(path, "rb")
+    try:
+        f.seek(max(0, os.fstat(f.fileno()).st_size - LOG_TAIL_BYTES))
+        out.write(b"".join(f.read().splitlines(keepends=True)[-lines:]))
+        out.flush()
+        
+        while True:
+            if kq is not None:
+                event = select.kevent(
+                    f.fileno(),
+                    filter=select.KQ_FILTER_VNODE,
+                    flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+                    fflags=(
+                        select.KQ_NOTE_WRITE | select.KQ_NOTE_EXTEND
+                        | select.KQ_NOTE_RENAME | select.KQ_NOTE_DELETE
+                    ),
+                )
+                kq.control([event], 1, 1.0)
+            else:
+                time.sleep(LOG_POLL_INTERVAL)
+            
+            data = f.read()
+            if data:
+                out.write(data)
+                out.flush()
+            
+            try:
+                current = os.stat(path)
+            except FileNotFoundError:
+                continue  # Rotated away; the new file isn't there yet
+            if current.st_ino != os.fstat(f.fileno()).st_ino:
+                f.close()
+                f = open(path, "rb")
+            elif current.st_size < f.tell():
+                f.seek(0)
+    finally:
+        f.close()
+        if kq is not None:
+            kq.close()
 
 
 # =============================================================================
@@ -72,59 +367,117 @@ class PlatformManager:
     def __init__(self, mode: str):
         self.mode = mode
         self.topology = self._load_topology()
-        self.services = self._parse_services()
+        self.services: dict[str, ServiceConfig] = self.topology.get("services", {})
+        self.mode_config = self.topology.get("modes", {}).get(self.mode, {})
+        
+        # Snapshot of the environment, layered under each native service's env
+        self._base_env = os.environ.copy()
+        
+        # Live PID per service as resolved by _get_pid (None = not running);
+        # kept current by _save_pid/_remove_pid for the life of one command
+        self._pid_cache: dict[str, Optional[int]] = {}
+        
+        # Batched `docker compose` calls in flight: name -> future error message
+        self._compose_batches: dict[str, Future] = {}
+        
+        # Kept-alive health-check connections, one per service
+        self._conns: dict[str, http.client.HTTPConnection] = {}
+        
+        # Per-thread output buffer so parallel service starts don't interleave
+        self._output = threading.local()
+        self._print_lock = threading.Lock()
         
         # Ensure directories exist
         PID_DIR.mkdir(parents=True, exist_ok=True)
         LOG_DIR.mkdir(parents=True, exist_ok=True)
 
     def _load_topology(self) -> dict:
-        """Load topology.yaml configuration."""
+        """Load topology.yaml, building ServiceConfig objects as it parses.
+
+        Service entries are validated and converted straight from their YAML
+        nodes, so errors can name the line they came from.
+        """
         if not TOPOLOGY_FILE.exists():
             print(f"{RED}Error: topology.yaml not found at {TOPOLOGY_FILE}{NC}")
             print("Run: platform init")
             sys.exit(1)
         
+        topology = {}
+        errors = []
         with open(TOPOLOGY_FILE) as f:
-            return yaml.safe_load(f)
+            loader = _YamlLoader(f)
+            try:
+                root = loader.get_single_node()
+                if not isinstance(root, yaml.MappingNode):
+                    errors.append("expected a mapping at the top level")
+                    root = yaml.MappingNode("tag:yaml.org,2002:map", [])
+                loader.flatten_mapping(root)
+                for key_node, value_node in root.value:
+                    key = loader.construct_object(key_node)
+                    if key == "services":
+                        if isinstance(value_node, yaml.MappingNode):
+                            topology[key] = self._load_services(loader, value_node, errors)
+                        else:
+                            line = value_node.start_mark.line + 1
+                            errors.append(f"line {line}: services: expected a mapping")
+                    else:
+                        topology[key] = loader.construct_object(value_node, deep=True)
+            finally:
+                loader.dispose()
+        
+        if errors:
+            print(f"{RED}Error: invalid topology.yaml at {TOPOLOGY_FILE}{NC}")
+            for error in errors:
+                print(f"  • {error}")
+            sys.exit(1)
+        return topology
 
-    def _parse_services(self) -> dict[str, ServiceConfig]:
-        """Parse services from topology."""
+    def _load_services(self, loader, node: yaml.MappingNode, errors: list[str]) -> dict[str, ServiceConfig]:
+        """Construct ServiceConfig objects from the `services` mapping node."""
         services = {}
-        for name, config in self.topology.get("services", {}).items():
-            services[name] = ServiceConfig(
-                name=name,
-                path=PLATFORM_ROOT / config["path"],
-                port=config["port"],
-                health_endpoint=config.get("health_endpoint", DEFAULT_HEALTH_ENDPOINT),
-                start_command=config.get("start", {}),
-                depends_on=config.get("depends_on", []),
-                env=config.get("env", {}),
-            )
+        loader.flatten_mapping(node)
+        for name_node, config_node in node.value:
+            name = loader.construct_object(name_node)
+            config = loader.construct_object(config_node, deep=True)
+            service_errors = _service_errors(name, config)
+            if service_errors:
+                line = config_node.start_mark.line + 1
+                errors.extend(f"line {line}: {error}" for error in service_errors)
+            else:
+                services[name] = _service_from_config(name, config)
         return services
 
-    def _get_startup_order(self) -> list[str]:
-        """Get services in dependency order."""
-        # Simple topological sort
-        visited = set()
-        order = []
-
-        def visit(name: str):
-            if name in visited:
-                return
-            visited.add(name)
-            service = self.services.get(name)
-            if service:
-                for dep in service.depends_on:
-                    visit(dep)
-                order.append(name)
-
-        for name in self.services:
-            visit(name)
-        return order
+    @cached_property
+    def _dependencies(self) -> dict[str, set[str]]:
+        """Each service's dependencies, limited to services in the topology."""
+        return {
+            name: {dep for dep in service.depends_on if dep in self.services}
+            for name, service in self.services.items()
+        }
+
+    @cached_property
+    def startup_order(self) -> tuple[str, ...]:
+        """Services in dependency order (computed once per manager)."""
+        try:
+            return tuple(graphlib.TopologicalSorter(self._dependencies).static_order())
+        except graphlib.CycleError as e:
+            print(f"{RED}Error: dependency cycle in topology.yaml: {' -> '.join(e.args[1])}{NC}")
+            sys.exit(1)
+
+    def _port_in_use(self, port: int) -> bool:
+        """Check if something is listening on a local port (no subprocess)."""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.settimeout(PORT_PROBE_TIMEOUT)
+            return sock.connect_ex((_LOCAL_IP, port)) == 0
 
     def _check_port(self, port: int) -> Optional[int]:
-        """Check if port is in use, return PID if so."""
+        """Check if port is in use, return PID if so.
+
+        Probes the port with a socket first and only forks `lsof` to
+        resolve the owning PID when something is actually listening.
+        """
+        if not self._port_in_use(port):
+            return None
         try:
             result = subprocess.run(
                 ["lsof", "-ti", f":{port}"],
@@ -138,90 +491,330 @@ class PlatformManager:
         return None
 
     def _wait_for_health(self, service: ServiceConfig, timeout: int = 60) -> bool:
-        """Wait for service to become healthy."""
-        import urllib.request
-        import urllib.error
+        """Wait for service to become healthy.
 
-        url = f"http://localhost:{service.port}{service.health_endpoint}"
-        start = time.time()
+        Each attempt first checks that the port is listening (a 50ms socket
+        probe) and only then issues the HTTP request. Attempts back off
+        exponentially from 100ms to 1s.
+        """
+        deadline = time.monotonic() + timeout
+        delay = HEALTH_POLL_INITIAL_DELAY
         
-        while time.time() - start < timeout:
-            try:
-                with urllib.request.urlopen(url, timeout=2) as response:
-                    if response.status == 200:
+        while time.monotonic() < deadline:
+            if self._port_in_use(service.port):
+                try:
+                    if self._http_probe(service, HEALTH_PROBE_TIMEOUT) == 200:
                         return True
-            except (urllib.error.URLError, ConnectionRefusedError, TimeoutError):
-                pass
-            time.sleep(1)
+                except (http.client.HTTPException, OSError):
+                    pass
+            time.sleep(max(0.0, min(delay, deadline - time.monotonic())))
+            delay = min(delay * 2, HEALTH_POLL_MAX_DELAY)
         
         return False
 
+    def _http_probe(self, service: ServiceConfig, timeout: float) -> int:
+        """GET a service's health endpoint and return the HTTP status.
+
+        Reuses one keep-alive HTTPConnection per service across retries and
+        commands. A connection the server has since closed is reopened once.
+        """
+        conn = self._conns.get(service.name)
+        if conn is None:
+            conn = self._conns.setdefault(
+                service.name,
+                http.client.HTTPConnection(_LOCAL_IP, service.port, timeout=timeout),
+            )
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+
+        for attempt in range(2):
+            try:
+                conn.request("GET", service.health_endpoint)
+                response = conn.getresponse()
+                response.read()  # Drain so the connection can be reused
+                return response.status
+            except (ConnectionResetError, BrokenPipeError, http.client.BadStatusLine):
+                # Stale keep-alive connection: reconnect and retry once
+                conn.close()
+                if attempt:
+                    raise
+            except Exception:
+                conn.close()
+                raise
+        raise http.client.HTTPException("unreachable")
+
+    async def _scan_services_async(self) -> dict[str, tuple[bool, Optional[int], Optional[int]]]:
+        """Probe every service concurrently.
+
+        Returns {name: (port_in_use, http_status, pid)}; http_status is None
+        when the health endpoint did not answer.
+        """
+        results = await asyncio.gather(
+            *(self._scan_service(service) for service in self.services.values())
+        )
+        return dict(zip(self.services, results))
+
+    async def _scan_service(self, service: ServiceConfig) -> tuple[bool, Optional[int], Optional[int]]:
+        """Port, health and PID probe for one service, all on one event loop."""
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(_LOCAL_IP, service.port), PORT_PROBE_TIMEOUT
+            )
+        except (OSError, asyncio.TimeoutError):
+            return False, None, self._get_pid(service.name)
+        
+        # The port answered: reuse the same connection for the health request
+        http_status = None
+        try:
+            writer.write(
+                f"GET {service.health_endpoint} HTTP/1.0\r\n"
+                f"Host: localhost:{service.port}\r\n\r\n".encode("ascii")
+            )
+            status_line = await asyncio.wait_for(reader.readuntil(b"\r\n"), SCAN_HTTP_TIMEOUT)
+            http_status = int(status_line.split(None, 2)[1])
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError,
+                asyncio.LimitOverrunError, ValueError, IndexError):
+            pass
+        finally:
+            writer.close()
+        
+        pid = self._get_pid(service.name) or await self._lsof_pid_async(service.port)
+        return True, http_status, pid
+
+    async def _lsof_pid_async(self, port: int) -> Optional[int]:
+        """Resolve the PID listening on `port` without blocking the event loop."""
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "lsof", "-ti", f":{port}",
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+            stdout, _ = await proc.communicate()
+            if proc.returncode == 0 and stdout.strip():
+                return int(stdout.split()[0])
+        except Exception:
+            pass
+        return None
+
     def _save_pid(self, service_name: str, pid: int):
         """Save service PID to file."""
         pid_file = PID_DIR / f"{service_name}.pid"
         pid_file.write_text(str(pid))
+        self._pid_cache[service_name] = pid
 
     def _get_pid(self, service_name: str) -> Optional[int]:
-        """Get saved PID for service."""
+        """Get saved PID for service (memoized for this command)."""
+        if service_name in self._pid_cache:
+            return self._pid_cache[service_name]
+        
+        pid = None
         pid_file = PID_DIR / f"{service_name}.pid"
         if pid_file.exists():
             try:
-                pid = int(pid_file.read_text().strip())
+                saved = int(pid_file.read_text().strip())
                 # Check if process still exists
-                os.kill(pid, 0)
-                return pid
+                os.kill(saved, 0)
+                pid = saved
             except (ValueError, ProcessLookupError, PermissionError):
                 pid_file.unlink(missing_ok=True)
-        return None
+        self._pid_cache[service_name] = pid
+        return pid
 
     def _remove_pid(self, service_name: str):
         """Remove PID file."""
         pid_file = PID_DIR / f"{service_name}.pid"
         pid_file.unlink(missing_ok=True)
+        self._pid_cache[service_name] = None
+
+    def _print(self, message: str = "") -> None:
+        """Print, or buffer when running inside a parallel service task."""
+        buffer = getattr(self._output, "buffer", None)
+        if buffer is None:
+            print(message)
+        else:
+            buffer.append(message)
+
+    def _run_buffered(
+        self,
+        action: Callable[[ServiceConfig], Optional[bool]],
+        service: ServiceConfig,
+    ) -> Optional[bool]:
+        """Run action for a service, flushing its output as one block."""
+        self._output.buffer = []
+        try:
+            return action(service)
+        finally:
+            lines = self._output.buffer
+            self._output.buffer = None
+            with self._print_lock:
+                for line in lines:
+                    print(line)
+
+    def _run_parallel(
+        self,
+        action: Callable[[ServiceConfig], Optional[bool]],
+        reverse: bool = False,
+        prepare: Optional[Callable[[list[ServiceConfig], Executor], None]] = None,
+    ) -> list[str]:
+        """
+        Run action for every service, concurrently where dependencies allow.
+
+        A service is submitted as soon as all of its dependencies have
+        finished (or, with reverse=True, all of its dependents), so wall time
+        follows the critical dependency path instead of the sum of waits.
+        If given, prepare is called with each wave of services that become
+        ready together (and the executor) before any of them is submitted.
+
+        Returns:
+            Names of services for which action returned False.
+        """
+        self.startup_order  # Exits on a dependency cycle before anything runs
+        graph = self._dependencies
+        if reverse:
+            dependents = {name: set() for name in graph}
+            for name, deps in graph.items():
+                for dep in deps:
+                    dependents[dep].add(name)
+            graph = dependents
+
+        sorter = graphlib.TopologicalSorter(graph)
+        sorter.prepare()
+        failed = []
+
+        with ThreadPoolExecutor(max_workers=max(len(graph), 1)) as executor:
+            running = {}
+            while sorter.is_active():
+                wave = [self.services[name] for name in sorter.get_ready()]
+                if wave and prepare:
+                    prepare(wave, executor)
+                for service in wave:
+                    future = executor.submit(self._run_buffered, action, service)
+                    running[future] = service.name
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    if future.result() is False:
+                        failed.append(name)
+                    sorter.done(name)
+
+        return failed
+
+    def _start_service(self, service: ServiceConfig) -> bool:
+        """Start a service using the launcher for its mode."""
+        if self.mode_config.get(service.name, "docker") == "docker":
+            return self._start_docker_service(service)
+        return self._start_native_service(service)
+
+    def _stop_service(self, service: ServiceConfig):
+        """Stop a service using the launcher for its mode."""
+        if self.mode_config.get(service.name, "docker") == "docker":
+            self._stop_docker_service(service)
+        else:
+            self._stop_native_service(service)
+
+    def _compose_wave(self, services: list[ServiceConfig], executor: Executor, stopping: bool = False):
+        """Batch `docker compose` for docker-mode services of a wave sharing a project.
+
+        Each project with two or more services in the wave gets one call,
+        submitted to the executor ahead of the services' own actions, which
+        wait on it. Everything else keeps its per-service call on its worker.
+        """
+        projects = defaultdict(list)
+        for service in services:
+            if self.mode_config.get(service.name, "docker") == "docker":
+                projects[service.path].append(service)
+        
+        for path, group in projects.items():
+            if len(group) < 2:
+                continue
+            batch = executor.submit(self._compose_batch, path, group, stopping)
+            for service in group:
+                self._compose_batches[service.name] = batch
+
+    def _compose_batch(self, path: Path, services: list[ServiceConfig], stopping: bool) -> Optional[str]:
+        """Run one compose call for services of a project, skipping any already up."""
+        if not stopping:
+            services = [service for service in services if not self._port_in_use(service.port)]
+            if not services:
+                return None
+        return self._compose(path, services, stopping)
+
+    def _compose(self, path: Path, services: list[ServiceConfig], stopping: bool = False) -> Optional[str]:
+        """Bring services of one compose project up (or down).
+
+        A project that hosts only these services gets the whole-project
+        `up -d` / `down`; one shared with other topology services has them
+        named explicitly (`up -d a b` / `stop a b`) so the rest are untouched.
+
+        Returns:
+            An error message, or None on success.
+        """
+        names = {service.name for service in services}
+        shared = any(
+            other.path == path and other.name not in names
+            for other in self.services.values()
+        )
+        if not shared:
+            args = ["down"] if stopping else ["up", "-d"]
+        else:
+            args = ["stop"] if stopping else ["up", "-d"]
+            args += [service.compose_service_name for service in services]
+        
+        try:
+            result = subprocess.run(
+                ["docker", "compose", *args],
+                cwd=path,
+                capture_output=True,
+                text=True,
+            )
+        except Exception as e:
+            return f"Error: {e}"
+        if result.returncode != 0:
+            return f"Failed: {result.stderr}"
+        return None
 
     def _start_docker_service(self, service: ServiceConfig) -> bool:
         """Start a Docker-based service."""
-        print(f"  {BLUE}Starting {service.name} (docker)...{NC}")
+        self._print(f"  {BLUE}Starting {service.name} (docker)...{NC}")
         
         # Check if already running
         existing_pid = self._check_port(service.port)
         if existing_pid:
-            print(f"    {YELLOW}Port {service.port} already in use (PID {existing_pid}){NC}")
+            self._print(f"    {YELLOW}Port {service.port} already in use (PID {existing_pid}){NC}")
             return True
         
+        # Brought up with the rest of its project when _compose_wave batched it
+        batch = self._compose_batches.get(service.name)
+        if batch is not None:
+            error = batch.result()
+        else:
+            error = self._compose(service.path, [service])
+        if error:
+            self._print(f"    {RED}{error}{NC}")
+            return False
+        
         try:
-            # Run docker compose up -d
-            result = subprocess.run(
-                ["docker", "compose", "up", "-d"],
-                cwd=service.path,
-                capture_output=True,
-                text=True,
-            )
-            
-            if result.returncode != 0:
-                print(f"    {RED}Failed: {result.stderr}{NC}")
-                return False
-            
             # Wait for health
             if self._wait_for_health(service, timeout=30):
-                print(f"    {GREEN}✓ {service.name} healthy on port {service.port}{NC}")
+                self._print(f"    {GREEN}✓ {service.name} healthy on port {service.port}{NC}")
                 return True
             else:
-                print(f"    {RED}✗ {service.name} failed health check{NC}")
+                self._print(f"    {RED}✗ {service.name} failed health check{NC}")
                 return False
                 
         except Exception as e:
-            print(f"    {RED}Error: {e}{NC}")
+            self._print(f"    {RED}Error: {e}{NC}")
             return False
 
     def _start_native_service(self, service: ServiceConfig) -> bool:
         """Start a native (non-Docker) service."""
-        print(f"  {BLUE}Starting {service.name} (native)...{NC}")
+        self._print(f"  {BLUE}Starting {service.name} (native)...{NC}")
         
         # Check if already running
         existing_pid = self._check_port(service.port)
         if existing_pid:
-            print(f"    {YELLOW}Port {service.port} already in use (PID {existing_pid}){NC}")
+            self._print(f"    {YELLOW}Port {service.port} already in use (PID {existing_pid}){NC}")
             self._save_pid(service.name, existing_pid)
             return True
         
@@ -230,19 +823,17 @@ class PlatformManager:
         # Get command for this mode
         cmd = service.start_command.get(self.mode) or service.start_command.get("native")
         if not cmd:
-            print(f"    {RED}No start command for mode '{self.mode}'{NC}")
+            self._print(f"    {RED}No start command for mode '{self.mode}'{NC}")
             return False
         
-        # Build environment
-        env = os.environ.copy()
-        env.update(service.env)
+        # Layer service env over the base env without copying it
+        env = ChainMap(service.env, self._base_env)
         
         try:
             # Start process with nohup, redirect output to log
             with open(log_file, "w") as log:
                 process = subprocess.Popen(
                     cmd,
-                    shell=True,
                     cwd=service.path,
                     env=env,
                     stdout=log,
@@ -254,33 +845,33 @@ class PlatformManager:
             
             # Wait for health
             if self._wait_for_health(service, timeout=60):
-                print(f"    {GREEN}✓ {service.name} healthy on port {service.port}{NC}")
+                self._print(f"    {GREEN}✓ {service.name} healthy on port {service.port}{NC}")
                 return True
             else:
-                print(f"    {RED}✗ {service.name} failed health check{NC}")
-                print(f"    Check logs: {log_file}")
+                self._print(f"    {RED}✗ {service.name} failed health check{NC}")
+                self._print(f"    Check logs: {log_file}")
                 return False
                 
         except Exception as e:
-            print(f"    {RED}Error: {e}{NC}")
+            self._print(f"    {RED}Error: {e}{NC}")
             return False
 
     def _stop_docker_service(self, service: ServiceConfig):
         """Stop a Docker-based service."""
-        print(f"  Stopping {service.name} (docker)...")
-        try:
-            subprocess.run(
-                ["docker", "compose", "down"],
-                cwd=service.path,
-                capture_output=True,
-            )
-            print(f"    {GREEN}✓ Stopped{NC}")
-        except Exception as e:
-            print(f"    {RED}Error: {e}{NC}")
+        self._print(f"  Stopping {service.name} (docker)...")
+        batch = self._compose_batches.get(service.name)
+        if batch is not None:
+            error = batch.result()
+        else:
+            error = self._compose(service.path, [service], stopping=True)
+        if error:
+            self._print(f"    {RED}{error}{NC}")
+        else:
+            self._print(f"    {GREEN}✓ Stopped{NC}")
 
     def _stop_native_service(self, service: ServiceConfig):
         """Stop a native service."""
-        print(f"  Stopping {service.name} (native)...")
+        self._print(f"  Stopping {service.name} (native)...")
         
         # Try saved PID first
         pid = self._get_pid(service.name)
@@ -291,20 +882,19 @@ class PlatformManager:
         if pid:
             try:
                 os.kill(pid, signal.SIGTERM)
-                time.sleep(1)
-                # Force kill if still running
-                try:
-                    os.kill(pid, 0)
-                    os.kill(pid, signal.SIGKILL)
-                except ProcessLookupError:
-                    pass
-                print(f"    {GREEN}✓ Stopped (PID {pid}){NC}")
+                # Force kill if still running after the grace period
+                if not _wait_for_exit(pid, STOP_GRACE_PERIOD):
+                    try:
+                        os.kill(pid, signal.SIGKILL)
+                    except ProcessLookupError:
+                        pass
+                self._print(f"    {GREEN}✓ Stopped (PID {pid}){NC}")
             except ProcessLookupError:
-                print(f"    {YELLOW}Process already stopped{NC}")
+                self._print(f"    {YELLOW}Process already stopped{NC}")
             except Exception as e:
-                print(f"    {RED}Error: {e}{NC}")
+                self._print(f"    {RED}Error: {e}{NC}")
         else:
-            print(f"    {YELLOW}Not running{NC}")
+            self._print(f"    {YELLOW}Not running{NC}")
         
         self._remove_pid(service.name)
 
@@ -313,28 +903,14 @@ class PlatformManager:
     # =========================================================================
 
     def up(self):
-        """Start all services in dependency order."""
+        """Start all services, in parallel where dependencies allow."""
         print(f"\n{GREEN}Starting platform in {self.mode} mode...{NC}\n")
         
         # Preflight checks
         if not self._preflight_checks():
             sys.exit(1)
         
-        order = self._get_startup_order()
-        mode_config = self.topology.get("modes", {}).get(self.mode, {})
-        
-        failed = []
-        for name in order:
-            service = self.services[name]
-            service_mode = mode_config.get(name, "docker")
-            
-            if service_mode == "docker":
-                success = self._start_docker_service(service)
-            else:
-                success = self._start_native_service(service)
-            
-            if not success:
-                failed.append(name)
+        failed = self._run_parallel(self._start_service, prepare=self._compose_wave)
         
         print()
         if failed:
@@ -347,18 +923,12 @@ class PlatformManager:
         """Stop all services."""
         print(f"\n{YELLOW}Stopping platform...{NC}\n")
         
-        # Stop in reverse dependency order
-        order = list(reversed(self._get_startup_order()))
-        mode_config = self.topology.get("modes", {}).get(self.mode, {})
-        
-        for name in order:
-            service = self.services[name]
-            service_mode = mode_config.get(name, "docker")
-            
-            if service_mode == "docker":
-                self._stop_docker_service(service)
-            else:
-                self._stop_native_service(service)
+        # Stop in reverse dependency order, dependents before their dependencies
+        self._run_parallel(
+            self._stop_service,
+            reverse=True,
+            prepare=lambda wave, executor: self._compose_wave(wave, executor, stopping=True),
+        )
         
         print(f"\n{GREEN}✓ Platform stopped{NC}")
 
@@ -366,28 +936,20 @@ class PlatformManager:
         """Show status of all services."""
         print(f"\n{BLUE}Platform Status (mode: {self.mode}){NC}\n")
         
-        mode_config = self.topology.get("modes", {}).get(self.mode, {})
+        # Probe every service at once; wall time is the slowest probe, not the sum
+        scan = asyncio.run(self._scan_services_async())
         
-        for name in self._get_startup_order():
+        for name in self.startup_order:
             service = self.services[name]
-            service_mode = mode_config.get(name, "docker")
-            
-            # Check health
-            import urllib.request
-            import urllib.error
-            
-            url = f"http://localhost:{service.port}{service.health_endpoint}"
-            try:
-                with urllib.request.urlopen(url, timeout=2) as response:
-                    if response.status == 200:
-                        status = f"{GREEN}● healthy{NC}"
-                    else:
-                        status = f"{YELLOW}● unhealthy{NC}"
-            except Exception:
+            service_mode = self.mode_config.get(name, "docker")
+            _, http_status, pid = scan[name]
+            if http_status == 200:
+                status = f"{GREEN}● healthy{NC}"
+            elif http_status is not None:
+                status = f"{YELLOW}● unhealthy{NC}"
+            else:
                 status = f"{RED}● stopped{NC}"
-            
-            pid = self._get_pid(name) or self._check_port(service.port) or "-"
-            print(f"  {name:25} {status:20} port:{service.port:5} pid:{pid} ({service_mode})")
+            print(f"  {name:25} {status:20} port:{service.port:5} pid:{pid or '-'} ({service_mode})")
         
         print()
 
@@ -412,10 +974,11 @@ class PlatformManager:
         
         # Check ports
         print("\nChecking ports...")
+        scan = asyncio.run(self._scan_services_async())
         for name, service in self.services.items():
-            pid = self._check_port(service.port)
-            if pid:
-                print(f"  Port {service.port} ({name}): {YELLOW}in use by PID {pid}{NC}")
+            port_in_use, _, pid = scan[name]
+            if port_in_use:
+                print(f"  Port {service.port} ({name}): {YELLOW}in use by PID {pid or 'unknown'}{NC}")
             else:
                 print(f"  Port {service.port} ({name}): {GREEN}available{NC}")
         
@@ -451,7 +1014,10 @@ class PlatformManager:
         if service_name:
             log_file = LOG_DIR / f"{service_name}.log"
             if log_file.exists():
-                subprocess.run(["tail", "-f", str(log_file)])
+                try:
+                    _tail(log_file)
+                except KeyboardInterrupt:
+                    print()
             else:
                 print(f"{RED}No logs for {service_name}{NC}")
         else:
@@ -464,22 +1030,21 @@ class PlatformManager:
         """Run preflight checks before starting."""
         print(f"{BLUE}Running preflight checks...{NC}\n")
         
-        passed = True
+        # Scan all ports concurrently, then stop at the first conflict
+        scan = asyncio.run(self._scan_services_async())
         
         # Check required ports are free (or have our services)
-        for name, service in self.services.items():
-            pid = self._check_port(service.port)
-            if pid:
-                saved_pid = self._get_pid(name)
-                if pid != saved_pid:
-                    print(f"  {RED}✗ Port {service.port} in use by unknown process (PID {pid}){NC}")
+        for name, (port_in_use, _, pid) in scan.items():
+            # A live saved PID means the port is ours
+            if port_in_use and self._get_pid(name) is None:
+                port = self.services[name].port
+                print(f"  {RED}✗ Port {port} in use by unknown process (PID {pid or 'unknown'}){NC}")
+                if pid:
                     print(f"    Run: kill {pid}")
-                    passed = False
-        
-        if passed:
-            print(f"  {GREEN}✓ All preflight checks passed{NC}\n")
+                return False
         
-        return passed
+        print(f"  {GREEN}✓ All preflight checks passed{NC}\n")
+        return True
 
 
 # =============================================================================
@@ -556,91 +1121,10 @@ Examples:
 
 def init_topology():
     """Create default topology.yaml."""
-    topology = {
-        "version": "1.0",
-        "modes": {
-            "docker": {
-                "qdrant": "docker",
-                "llm-gateway": "docker",
-                "semantic-search": "docker",
-                "code-orchestrator": "docker",
-                "inference": "docker",
-            },
-            "hybrid": {
-                "qdrant": "docker",
-                "llm-gateway": "docker",
-                "semantic-search": "docker",
-                "code-orchestrator": "docker",
-                "inference": "native",  # Native for Metal GPU
-            },
-            "native": {
-                "qdrant": "docker",  # Qdrant always Docker
-                "llm-gateway": "native",
-                "semantic-search": "native",
-                "code-orchestrator": "native",
-                "inference": "native",
-            },
-        },
-        "services": {
-            "qdrant": {
-                "path": "qdrant",
-                "port": 6333,
-                "health_endpoint": "/healthz",
-                "start": {
-                    "docker": DOCKER_COMPOSE_UP_CMD,
-                },
-                "depends_on": [],
-            },
-            "inference": {
-                "path": "inference-service",
-                "port": 8085,
-                "health_endpoint": DEFAULT_HEALTH_ENDPOINT,
-                "start": {
-                    "docker": DOCKER_COMPOSE_UP_CMD,
-                    "native": "source .venv/bin/activate && python -m uvicorn src.main:app --host 0.0.0.0 --port 8085",
-                },
-                "env": {
-                    "INFERENCE_MODELS_DIR": "/Users/kevintoles/POC/ai-models/models",
-                    "INFERENCE_CONFIG_DIR": "/Users/kevintoles/POC/inference-service/config",
-                    "INFERENCE_GPU_LAYERS": "-1",
-                    "INFERENCE_DEFAULT_PRESET": "",  # No auto-load, load on demand
-                },
-                "depends_on": [],
-            },
-            "llm-gateway": {
-                "path": "llm-gateway",
-                "port": 8080,
-                "health_endpoint": DEFAULT_HEALTH_ENDPOINT,
-                "start": {
-                    "docker": DOCKER_COMPOSE_UP_CMD,
-                },
-                "depends_on": ["inference"],
-            },
-            "semantic-search": {
-                "path": "semantic-search-service",
-                "port": 8084,
-                "health_endpoint": DEFAULT_HEALTH_ENDPOINT,
-                "start": {
-                    "docker": DOCKER_COMPOSE_UP_CMD,
-                },
-                "depends_on": ["qdrant"],
-            },
-            "code-orchestrator": {
-                "path": "Code-Orchestrator-Service",
-                "port": 8083,
-                "health_endpoint": DEFAULT_HEALTH_ENDPOINT,
-                "start": {
-                    "docker": DOCKER_COMPOSE_UP_CMD,
-                },
-                "depends_on": ["llm-gateway", "semantic-search"],
-            },
-        },
-    }
-    
     TOPOLOGY_FILE.parent.mkdir(parents=True, exist_ok=True)
     
     with open(TOPOLOGY_FILE, "w") as f:
-        yaml.dump(topology, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(DEFAULT_TOPOLOGY, f, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
     
     print(f"{GREEN}Created {TOPOLOGY_FILE}{NC}")
     print("\nEdit this file to customize your platform topology.")
@@ -20,8 +20,21 @@ Log output:
 """
 
 import json
+import re
 import sys
 from datetime import datetime, timezone
+from typing import Callable
+
+# key:value tokens; the key stops at the first colon like str.split(":", 1)
+_KV_RE = re.compile(r"([^\s:]+):(\S*)")
+
+# Bound once: called for every logged event
+_now = datetime.now
+_UTC = timezone.utc
+
+# Invariant bytes of every log line; matches json.dumps() default separators
+_LOG_PREFIX = b'{"timestamp": "'
+_LOG_INVARIANT = b'", "level": "INFO", "service": "supervisor-event-listener", '
 
 
 def write_stdout(message: str) -> None:
@@ -33,10 +46,11 @@ def write_stdout(message: str) -> None:
     sys.stdout.flush()
 
 
-def write_stderr(message: str) -> None:
-    """Write a message to stderr for logging."""
-    sys.stderr.write(f"{message}\n")
-    sys.stderr.flush()
+def _emit(line: bytes) -> None:
+    """Write one pre-encoded log line to stderr in a single write."""
+    stderr = sys.stderr.buffer
+    stderr.write(line)
+    stderr.flush()
 
 
 def log_event(event_type: str, process_name: str, details: dict) -> None:
@@ -47,16 +61,20 @@ def log_event(event_type: str, process_name: str, details: dict) -> None:
         process_name: Name of the affected process
         details: Additional event details
     """
-    log_entry = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "level": "INFO",
-        "service": "supervisor-event-listener",
+    # Only the variable fields go through json; the rest is a bytes prefix
+    variable = json.dumps({
         "event_type": event_type,
         "process_name": process_name,
         "message": f"Process {process_name}: {event_type}",
         **details
-    }
-    write_stderr(json.dumps(log_entry))
+    })
+    _emit(
+        _LOG_PREFIX
+        + _now(_UTC).isoformat().encode()
+        + _LOG_INVARIANT
+        + variable[1:].encode()
+        + b"\n"
+    )
 
 
 def parse_event_data(data: str) -> dict:
@@ -68,12 +86,59 @@ def parse_event_data(data: str) -> dict:
     Returns:
         Dictionary of parsed values
     """
-    result = {}
-    for item in data.split():
-        if ":" in item:
-            key, value = item.split(":", 1)
-            result[key] = value
-    return result
+    return dict(_KV_RE.findall(data))
+
+
+def _process_details(payload_data: dict) -> dict:
+    """Details common to every process state event."""
+    return {
+        "group": payload_data.get("groupname", "unknown"),
+        "from_state": payload_data.get("from_state", "unknown")
+    }
+
+
+def _handle_exited(payload_data: dict) -> tuple[str, dict]:
+    """PROCESS_STATE_EXITED: include exit code and whether it was expected."""
+    expected = payload_data.get("expected", "0")
+    return "PROCESS_EXITED", {
+        **_process_details(payload_data),
+        "exit_code": payload_data.get("exitcode", "unknown"),
+        "expected": expected == "1",
+        "severity": "WARNING" if expected == "0" else "INFO"
+    }
+
+
+def _handle_stopped(payload_data: dict) -> tuple[str, dict]:
+    """PROCESS_STATE_STOPPED."""
+    return "PROCESS_STOPPED", _process_details(payload_data)
+
+
+def _handle_starting(payload_data: dict) -> tuple[str, dict]:
+    """PROCESS_STATE_STARTING."""
+    return "PROCESS_STARTING", _process_details(payload_data)
+
+
+def _handle_running(payload_data: dict) -> tuple[str, dict]:
+    """PROCESS_STATE_RUNNING."""
+    return "PROCESS_RUNNING", _process_details(payload_data)
+
+
+def _handle_fatal(payload_data: dict) -> tuple[str, dict]:
+    """PROCESS_STATE_FATAL: logged with ERROR severity."""
+    return "PROCESS_FATAL", {
+        **_process_details(payload_data),
+        "severity": "ERROR"
+    }
+
+
+# Supervisor event name -> handler returning (event_type, details)
+_HANDLERS: dict[str, Callable[[dict], tuple[str, dict]]] = {
+    "PROCESS_STATE_EXITED": _handle_exited,
+    "PROCESS_STATE_STOPPED": _handle_stopped,
+    "PROCESS_STATE_STARTING": _handle_starting,
+    "PROCESS_STATE_RUNNING": _handle_running,
+    "PROCESS_STATE_FATAL": _handle_fatal,
+}
 
 
 def main() -> None:
@@ -86,85 +151,37 @@ def main() -> None:
     4. Process the event
     5. Write "RESULT 2\nOK" or "RESULT 4\nFAIL"
     6. Repeat
+    
+    Reads the binary stdin buffer so the payload `len` (a byte count) is
+    honoured exactly.
     """
+    stdin = sys.stdin.buffer
     while True:
         # Signal that we're ready for events
         write_stdout("READY\n")
         
         # Read header line
-        header_line = sys.stdin.readline()
+        header_line = stdin.readline()
         if not header_line:
             break
             
         # Parse header
-        headers = parse_event_data(header_line)
+        headers = parse_event_data(header_line.decode())
         event_name = headers.get("eventname", "UNKNOWN")
         payload_length = int(headers.get("len", 0))
         
         # Read payload
-        payload = sys.stdin.read(payload_length) if payload_length > 0 else ""
-        payload_data = parse_event_data(payload)
-        
-        # Extract process information
-        process_name = payload_data.get("processname", "unknown")
-        group_name = payload_data.get("groupname", "unknown")
-        from_state = payload_data.get("from_state", "unknown")
+        payload = stdin.read(payload_length) if payload_length > 0 else b""
+        payload_data = parse_event_data(payload.decode())
         
         # Log based on event type
-        if event_name == "PROCESS_STATE_EXITED":
-            expected = payload_data.get("expected", "0")
-            exit_code = payload_data.get("exitcode", "unknown")
-            log_event(
-                event_type="PROCESS_EXITED",
-                process_name=process_name,
-                details={
-                    "group": group_name,
-                    "from_state": from_state,
-                    "exit_code": exit_code,
-                    "expected": expected == "1",
-                    "severity": "WARNING" if expected == "0" else "INFO"
-                }
-            )
-            
-        elif event_name == "PROCESS_STATE_STOPPED":
-            log_event(
-                event_type="PROCESS_STOPPED",
-                process_name=process_name,
-                details={
-                    "group": group_name,
-                    "from_state": from_state
-                }
-            )
-            
-        elif event_name == "PROCESS_STATE_STARTING":
-            log_event(
-                event_type="PROCESS_STARTING",
-                process_name=process_name,
-                details={
-                    "group": group_name,
-                    "from_state": from_state
-                }
-            )
-            
-        elif event_name == "PROCESS_STATE_RUNNING":
-            log_event(
-                event_type="PROCESS_RUNNING",
-                process_name=process_name,
-                details={
-                    "group": group_name,
-                    "from_state": from_state
-                }
-            )
-            
-        elif event_name == "PROCESS_STATE_FATAL":
+        handler = _HANDLERS.get(event_name)
+        if handler:
+            event_type, details = handler(payload_data)
             log_event(
-                event_type="PROCESS_FATAL",
-                process_name=process_name,
-                details={
-                    "group": group_name,
-                    "from_state": from_state,
-                    "severity": "ERROR"
-                }
+                event_type=event_type,
+                process_name=payload_data.get("processname", "unknown"),
+                details=details
             )
         
         # Acknowledge the event